@@ -2,6 +2,54 @@
 import argparse
 import pandas as pd
 
+# Metrics that can be ranked: column name -> display name.
+METRICS = {
+    "TotalICLRPoints": "Total ICLR Points",
+    "AdjICLRPoints": "Adjusted ICLR Points",
+    "TotalICLRPointsPerYear": "Total ICLR Points Per Year",
+    "AdjICLRPointsPerYear": "Adjusted ICLR Points Per Year",
+}
+
+# Groupings available for per-group rankings: CLI name -> grouping column in auth_df.
+GROUPS = {
+    "dept": "dept",
+    "area": "real_area",
+    "parent_area": "ParentArea",
+}
+
+
+def group_stats(auth_df: pd.DataFrame, faculty_stats: pd.DataFrame, group_col: str) -> pd.DataFrame:
+    """Aggregate each faculty's ICLR points within every value of `group_col`.
+
+    Per-year metrics use the faculty's overall YearsActive.
+    """
+    stats = auth_df.groupby(["name", group_col]).agg(
+        TotalICLRPoints=("RowICLRPoints", "sum"),
+        AdjICLRPoints=("RowAdjICLRPoints", "sum"),
+    ).reset_index().rename(columns={group_col: "Group"})
+    faculty = faculty_stats.set_index("name")
+    stats.insert(1, "Dept", stats["name"].map(faculty["Dept"]))
+    years_active = stats["name"].map(faculty["YearsActive"])
+    stats["TotalICLRPointsPerYear"] = stats["TotalICLRPoints"] / years_active
+    stats["AdjICLRPointsPerYear"] = stats["AdjICLRPoints"] / years_active
+    return stats
+
+
+def top_k_per_group(stats: pd.DataFrame, metric: str, k: int) -> pd.DataFrame:
+    """Return the top-k rows by `metric` within each Group.
+
+    groupby().rank() sorts every row once. That is not a partial selection,
+    but it is one vectorized pass, whereas a per-group nlargest() runs a
+    Python-level apply per group and is much slower with many groups.
+    """
+    rank = stats.groupby("Group")[metric].rank(method="first", ascending=False)
+    rows = stats[rank <= k].copy()
+    rows.insert(0, "Rank", rank[rank <= k].astype(int))
+    rows = rows.sort_values(by=["Group", "Rank"])
+    rows.insert(0, "Metric", METRICS[metric])
+    return rows
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Compute ICLR points per faculty based on iclr.csv, generated-author-info.csv, and conferences.csv."
@@ -12,6 +60,14 @@ def main():
                         help="Output CSV file name for detailed faculty metrics (default: faculty_iclr_details.csv)")
     parser.add_argument("--top10_output", type=str, default="faculty_iclr_top10.csv",
                         help="Output CSV file name for top 10 rankings (default: faculty_iclr_top10.csv)")
+    parser.add_argument("--top_k", type=int, default=10,
+                        help="Number of faculty to keep per group in grouped rankings (default: 10)")
+    parser.add_argument("--group_by", type=str, nargs="*", default=[], choices=sorted(GROUPS),
+                        help="Groupings for per-group top-k rankings (any of: dept, area, parent_area)")
+    parser.add_argument("--metrics", type=str, nargs="+", default=list(METRICS), choices=list(METRICS),
+                        help="Metrics to rank in grouped rankings (default: all)")
+    parser.add_argument("--grouped_output", type=str, default="faculty_iclr_topk_by_group.csv",
+                        help="Output CSV file name for per-group top-k rankings (default: faculty_iclr_topk_by_group.csv)")
     args = parser.parse_args()
     
     # Load conferences.csv to map conference code to its actual research area.
@@ -20,6 +76,8 @@ def main():
     confs = confs[confs["NextTier"].astype(str).str.lower() == "false"]
     # Build mapping: conference code -> research area
     conf_to_area = confs.set_index("Conference")["Area"].to_dict()
+    # Build mapping: research area -> parent area
+    area_to_parent = confs.drop_duplicates("Area").set_index("Area")["ParentArea"].to_dict()
     
     # Load the ICLR points per research area (from iclr.csv).
     iclr_df = pd.read_csv("iclr.csv")
@@ -39,6 +97,8 @@ def main():
     # Compute the ICLR contribution for each publication.
     auth_df["RowICLRPoints"] = auth_df["count"] * auth_df["ICLRPoint"]
     auth_df["RowAdjICLRPoints"] = auth_df["adjustedcount"] * auth_df["ICLRPoint"]
+    # Parent area of each publication row, for per-parent-area rankings.
+    auth_df["ParentArea"] = auth_df["real_area"].map(area_to_parent)
     
     # Group by faculty ("name") and aggregate metrics.
     group = auth_df.groupby("name")
@@ -67,15 +127,8 @@ def main():
     
     # Build the top-10 rankings for each metric.
     top10_dfs = []
-    metrics = [
-        ("TotalICLRPoints", "Total ICLR Points"),
-        ("AdjICLRPoints", "Adjusted ICLR Points"),
-        ("TotalICLRPointsPerYear", "Total ICLR Points Per Year"),
-        ("AdjICLRPointsPerYear", "Adjusted ICLR Points Per Year")
-    ]
-    
-    for col, metric_name in metrics:
-        top10 = faculty_stats.sort_values(by=col, ascending=False).head(10).copy()
+    for col, metric_name in METRICS.items():
+        top10 = faculty_stats.nlargest(10, col).copy()
         top10["Metric"] = metric_name
         # Reorder so that the "Metric" column comes first.
         cols = ["Metric"] + list(top10.columns.drop("Metric"))
@@ -85,6 +138,19 @@ def main():
     top10_all = pd.concat(top10_dfs, ignore_index=True)
     top10_all.to_csv(args.top10_output, index=False)
     print(f"Top 10 rankings for each metric written to {args.top10_output}")
+    
+    # Build the per-group top-k rankings, if requested.
+    if args.group_by:
+        grouped_dfs = []
+        for g in args.group_by:
+            stats = group_stats(auth_df, faculty_stats, GROUPS[g])
+            for metric in args.metrics:
+                top = top_k_per_group(stats, metric, args.top_k)
+                top.insert(1, "GroupBy", g)
+                grouped_dfs.append(top)
+        grouped_all = pd.concat(grouped_dfs, ignore_index=True)
+        grouped_all.to_csv(args.grouped_output, index=False)
+        print(f"Top {args.top_k} rankings per {', '.join(args.group_by)} written to {args.grouped_output}")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -23,27 +23,24 @@ for area, conf_list in areadict.items():
     for conf in conf_list:
         confdict[conf] = area
 
-def pagecount(pages: str) -> int:
-    if pages:
-        parts = pages.split("-")
-        if len(parts) == 2:
-            try:
-                start = int(parts[0])
-                end = int(parts[1])
-                return end - start + 1
-            except ValueError:
-                return -1
-    return -1
-
-def startpage(pages: str) -> int:
-    if pages:
-        parts = pages.split("-")
-        if parts:
-            try:
-                return int(parts[0])
-            except ValueError:
-                return -1
-    return -1
+def parse_pages(pages: str):
+    """Return (page count, start page) of a page range, -1 where unknown.
+
+    Splits the range once instead of once per value.
+    """
+    if not pages:
+        return -1, -1
+    parts = pages.split("-")
+    try:
+        start = int(parts[0])
+    except ValueError:
+        return -1, -1
+    if len(parts) == 2:
+        try:
+            return int(parts[1]) - start + 1, start
+        except ValueError:
+            pass
+    return -1, start
 
 def handle_article(article, conference_filter: str, counts: dict):
     # Skip records with no authors
@@ -122,8 +119,7 @@ def handle_article(article, conference_filter: str, counts: dict):
     if year < 1970 or year > 2269:
         return True
 
-    pcount = pagecount(pages)
-    spage = startpage(pages)
+    pcount, spage = parse_pages(pages)
     title = article.get("title", "")
     if isinstance(title, dict):
         title = title.get("#text", "")
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+import argparse
+import os
+import pandas as pd
+
+# Tables to compare: name -> (file, key column, value column used for ranking).
+TABLES = {
+    "iclr": ("iclr.csv", "Area", "ICLRPoint"),
+    "faculty": ("faculty_iclr_details.csv", "name", "AdjICLRPoints"),
+    "institute": ("institute_adjusted_ranked.csv", "Institute", "AdjustedICLRPoints"),
+}
+
+
+def load_table(path: str, key: str, value: str) -> pd.DataFrame:
+    """Load a snapshot table indexed by `key`, with a Rank column on `value`."""
+    df = pd.read_csv(path)
+    df = df.drop_duplicates(subset=key).set_index(key)
+    df["Rank"] = df[value].rank(ascending=False, method="min")
+    return df
+
+
+def load_snapshot(snapshot_dir: str) -> dict:
+    """Load every table present in a snapshot directory."""
+    tables = {}
+    for name, (f, key, value) in TABLES.items():
+        path = os.path.join(snapshot_dir, f)
+        if os.path.exists(path):
+            tables[name] = load_table(path, key, value)
+    return tables
+
+
+def diff_table(old: pd.DataFrame, new: pd.DataFrame, value: str) -> pd.DataFrame:
+    """Join two versions of a table on their key and compute per-row deltas."""
+    cols = [value, "Rank"]
+    merged = old[cols].join(new[cols], how="outer", lsuffix="_old", rsuffix="_new")
+    in_old = merged.index.isin(old.index)
+    in_new = merged.index.isin(new.index)
+
+    merged["Status"] = "unchanged"
+    merged.loc[~in_old, "Status"] = "added"
+    merged.loc[~in_new, "Status"] = "removed"
+    merged[f"{value}_delta"] = merged[f"{value}_new"] - merged[f"{value}_old"]
+    # Positive rank change means the row moved up.
+    merged["Rank_delta"] = merged["Rank_old"] - merged["Rank_new"]
+    changed = in_old & in_new & (
+        (merged[f"{value}_delta"].fillna(0) != 0) | (merged["Rank_delta"].fillna(0) != 0)
+    )
+    merged.loc[changed, "Status"] = "changed"
+    return merged.reset_index()
+
+
+def summarize(name: str, diff: pd.DataFrame, key: str, value: str, top: int) -> None:
+    counts = diff["Status"].value_counts()
+    print(
+        f"{name}: {counts.get('added', 0)} added, {counts.get('removed', 0)} removed, "
+        f"{counts.get('changed', 0)} changed, {counts.get('unchanged', 0)} unchanged"
+    )
+    moved = diff[diff["Status"] == "changed"]
+    for label, rows in (
+        ("up", moved[moved["Rank_delta"] > 0].nlargest(top, "Rank_delta")),
+        ("down", moved[moved["Rank_delta"] < 0].nsmallest(top, "Rank_delta")),
+    ):
+        for _, row in rows.iterrows():
+            print(
+                f"  {label}: {row[key]} rank {row['Rank_old']:.0f} -> {row['Rank_new']:.0f} "
+                f"({value} {row[f'{value}_delta']:+.3f})"
+            )
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Report changes in ICLR points, faculty and institute rankings between two snapshots."
+    )
+    parser.add_argument("old", type=str, help="Directory containing the old snapshot outputs.")
+    parser.add_argument("new", type=str, help="Directory containing the new snapshot outputs.")
+    parser.add_argument(
+        "--output_prefix",
+        type=str,
+        default="diff",
+        help="Prefix for the per-row delta CSV files (default: diff, e.g. diff_faculty.csv)",
+    )
+    parser.add_argument(
+        "--top",
+        type=int,
+        default=5,
+        help="Number of biggest movers up/down to show in the report. Default: 5",
+    )
+    args = parser.parse_args()
+
+    old_tables = load_snapshot(args.old)
+    new_tables = load_snapshot(args.new)
+
+    for name, (_, key, value) in TABLES.items():
+        if name not in old_tables or name not in new_tables:
+            print(f"{name}: missing in one of the snapshots, skipped")
+            continue
+        diff = diff_table(old_tables[name], new_tables[name], value)
+        output = f"{args.output_prefix}_{name}.csv"
+        diff.to_csv(output, index=False)
+        summarize(name, diff, key, value, args.top)
+        print(f"  per-row deltas written to {output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,271 @@
+#!/usr/bin/env python3
+import argparse
+import hashlib
+import json
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+
+# Upstream data files: local file name -> source URL.
+FILES = {
+    "dblp.xml.gz": "https://csrankings.org/dblp.xml.gz",
+    "generated-author-info.csv": "https://csrankings.org/generated-author-info.csv",
+    "csrankings.py": "https://raw.githubusercontent.com/emeryberger/CSrankings/refs/heads/gh-pages/util/csrankings.py",
+    "sigcse-research-articles.csv": "https://raw.githubusercontent.com/emeryberger/CSrankings/refs/heads/gh-pages/sigcse-research-articles.csv",
+}
+
+CHUNK_SIZE = 1 << 20
+
+
+def sha256sum(path: str) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def file_stamp(path: str) -> str:
+    st = os.stat(path)
+    return f"{st.st_size}:{st.st_mtime_ns}"
+
+
+def local_matches(path: str, entry: Dict[str, str]) -> bool:
+    """Check that `path` is the copy recorded in `entry`.
+
+    The size/mtime stamp is checked first so that unchanged files are not rehashed.
+    """
+    if not os.path.exists(path) or "sha256" not in entry:
+        return False
+    if entry.get("stamp") == file_stamp(path):
+        return True
+    return entry["sha256"] == sha256sum(path)
+
+
+def content_range_start(value: str) -> int:
+    """Return the first byte of a "bytes START-END/TOTAL" Content-Range, or -1."""
+    unit, _, rest = value.strip().partition(" ")
+    start = rest.split("-", 1)[0]
+    if unit != "bytes" or not start.isdigit():
+        return -1
+    return int(start)
+
+
+def load_manifest(filename: str) -> Dict[str, Dict[str, str]]:
+    try:
+        with open(filename, encoding="utf-8") as f:
+            return json.load(f)
+    except (FileNotFoundError, ValueError):
+        return {}
+
+
+def save_manifest(filename: str, manifest: Dict[str, Dict[str, str]]) -> None:
+    tmp = filename + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    os.replace(tmp, filename)
+
+
+def fetch(
+    session: requests.Session,
+    name: str,
+    url: str,
+    entry: Dict[str, str],
+    expected_sha256: Optional[str] = None,
+    timeout: float = 60,
+) -> Dict[str, str]:
+    """Download `url` to `name` unless the server reports it unchanged.
+
+    `entry` is the manifest record from the previous fetch (ETag,
+    Last-Modified and sha256 of the local copy). Returns the new record,
+    with "changed" set to "true" if the local file was replaced.
+    """
+    part = name + ".part"
+    # Ask for the raw bytes so that lengths, ranges and checksums refer to the file itself.
+    headers = {"Accept-Encoding": "identity"}
+
+    # Only send conditional headers if the local copy is the one we recorded
+    # (and, if a checksum was given, the one we expect).
+    if local_matches(name, entry) and expected_sha256 in (None, entry["sha256"]):
+        if "etag" in entry:
+            headers["If-None-Match"] = entry["etag"]
+        if "last_modified" in entry:
+            headers["If-Modified-Since"] = entry["last_modified"]
+
+    # Resume a partial download, but only if it belongs to the same remote version.
+    offset = os.path.getsize(part) if os.path.exists(part) else 0
+    validator = entry.get("part_etag") or entry.get("part_last_modified")
+    if offset and validator:
+        headers["Range"] = f"bytes={offset}-"
+        headers["If-Range"] = validator
+    else:
+        offset = 0
+
+    with session.get(url, headers=headers, stream=True, timeout=timeout) as resp:
+        if resp.status_code == 304:
+            # The local copy is current, so any partial download is obsolete.
+            if offset:
+                os.remove(part)
+            entry.pop("part_etag", None)
+            entry.pop("part_last_modified", None)
+            return dict(entry, stamp=file_stamp(name), changed="false")
+        restart = resp.status_code == 416 and "Range" in headers
+        if resp.status_code == 206 and content_range_start(resp.headers.get("Content-Range", "")) != offset:
+            # The server sent a different range than we asked for.
+            if "Range" not in headers:
+                raise IOError(f"{name}: unexpected partial response without a Range request")
+            restart = True
+        if restart:
+            # The partial file is stale or unusable: start over without Range.
+            resp.close()
+            os.remove(part)
+            entry.pop("part_etag", None)
+            entry.pop("part_last_modified", None)
+            return fetch(session, name, url, entry, expected_sha256, timeout)
+        resp.raise_for_status()
+
+        new_entry = {}
+        if resp.headers.get("ETag"):
+            new_entry["etag"] = resp.headers["ETag"]
+        if resp.headers.get("Last-Modified"):
+            new_entry["last_modified"] = resp.headers["Last-Modified"]
+
+        if resp.status_code != 206:
+            # Full response: the server ignored or rejected the range.
+            offset = 0
+        # Remember the validators of the partial file in case we are interrupted.
+        entry.pop("part_etag", None)
+        entry.pop("part_last_modified", None)
+        if "etag" in new_entry:
+            entry["part_etag"] = new_entry["etag"]
+        elif "last_modified" in new_entry:
+            entry["part_last_modified"] = new_entry["last_modified"]
+
+        expected_len = resp.headers.get("Content-Length")
+        written = 0
+        with open(part, "ab" if offset else "wb") as f:
+            for chunk in resp.iter_content(CHUNK_SIZE):
+                f.write(chunk)
+                written += len(chunk)
+        if expected_len is not None and written != int(expected_len):
+            raise IOError(f"{name}: expected {expected_len} bytes, got {written}")
+
+    digest = sha256sum(part)
+    if expected_sha256 and digest != expected_sha256:
+        os.remove(part)
+        raise IOError(f"{name}: checksum mismatch (expected {expected_sha256}, got {digest})")
+    new_entry["sha256"] = digest
+
+    # Leave the local file (and its mtime) alone if the content did not change,
+    # so that make does not rebuild downstream targets.
+    if local_matches(name, new_entry):
+        os.remove(part)
+        new_entry["changed"] = "false"
+    else:
+        os.replace(part, name)
+        new_entry["changed"] = "true"
+    new_entry["stamp"] = file_stamp(name)
+    return new_entry
+
+
+def fetch_all(
+    files: Dict[str, str],
+    manifest: Dict[str, Dict[str, str]],
+    checksums: Dict[str, str],
+    jobs: int,
+) -> Tuple[Dict[str, Dict[str, str]], List[str]]:
+    """Fetch all files concurrently over a shared connection pool.
+
+    Returns the new manifest records and the names of the files that failed.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=jobs, pool_maxsize=jobs)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+
+    results = {}
+    errors = []
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        futures = {
+            name: pool.submit(
+                fetch, session, name, url, manifest.setdefault(name, {}), checksums.get(name)
+            )
+            for name, url in files.items()
+        }
+        for name, future in futures.items():
+            try:
+                results[name] = future.result()
+            except Exception as e:
+                # Keep the old record (including any partial-download validators).
+                results[name] = manifest[name]
+                errors.append(name)
+                print(f"Error fetching {name}:", e, file=sys.stderr)
+    session.close()
+    return results, errors
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Fetch the upstream data files concurrently, skipping unchanged files."
+    )
+    parser.add_argument(
+        "--manifest",
+        type=str,
+        default=".fetch_manifest.json",
+        help="JSON file recording ETag/Last-Modified/sha256 per file (default: .fetch_manifest.json)",
+    )
+    parser.add_argument(
+        "--mirror",
+        type=str,
+        default="",
+        help="If provided, fetch every file from <mirror>/<file name> instead of upstream.",
+    )
+    parser.add_argument(
+        "--sha256",
+        type=str,
+        nargs="*",
+        default=[],
+        metavar="FILE=DIGEST",
+        help="Expected sha256 digests to verify downloads against.",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=len(FILES),
+        help=f"Number of concurrent downloads (default: {len(FILES)})",
+    )
+    args = parser.parse_args()
+
+    files = dict(FILES)
+    if args.mirror:
+        files = {name: args.mirror.rstrip("/") + "/" + name for name in files}
+    checksums = {}
+    for s in args.sha256:
+        name, sep, digest = s.partition("=")
+        if not sep or not digest:
+            parser.error(f"--sha256 expects FILE=DIGEST, got {s!r}")
+        if name not in FILES:
+            parser.error(f"--sha256: unknown file {name!r} (expected one of: {', '.join(FILES)})")
+        checksums[name] = digest
+
+    manifest = load_manifest(args.manifest)
+    results, errors = fetch_all(files, manifest, checksums, args.jobs)
+
+    for name, entry in results.items():
+        if name in errors:
+            continue
+        status = "updated" if entry.pop("changed") == "true" else "unchanged"
+        print(f"{name}: {status}")
+    # Save the records of the files that did succeed, so they are not refetched.
+    save_manifest(args.manifest, results)
+    if errors:
+        print(f"Failed to fetch: {', '.join(errors)}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -4,10 +4,13 @@ import contextlib
 import gzip
 import xmltodict
 import csv
+import re
 import sys
 from collections import defaultdict
 from typing import Any, Dict, List
 
+from unidecode import unidecode
+
 # Import functions and constants from csrankings.
 from csrankings import (
     Area,
@@ -35,6 +38,16 @@ candidate_parent: Dict[str, Dict[str, float]] = defaultdict(lambda: defaultdict(
 # Set of candidate names (from can_names.csv).
 candidate_names = set()
 
+# Name index: normalized candidate name key -> integer author ID.
+name_ids: Dict[str, int] = {}
+# Author ID -> candidate names sharing that ID.
+candidate_ids: Dict[int, List[str]] = defaultdict(list)
+# Raw dblp author string -> author ID (-1 if not in the index), filled during the scan.
+author_id_cache: Dict[str, int] = {}
+
+# dblp disambiguates homonyms with a numeric suffix, e.g. "Wei Wang 0001".
+DBLP_SUFFIX = re.compile(r"\s+\d{4}$")
+
 # Mappings from conferences.csv:
 #  - conf_to_area: conference abbreviation -> real research area.
 #  - conf_to_parent: conference abbreviation -> parent area.
@@ -55,6 +68,38 @@ def load_candidate_names(filename: str) -> None:
     print(f"Loaded {len(candidate_names)} candidate names.")
 
 
+def name_key(name: str) -> str:
+    """Normalize an author name: transliterate, case-fold and collapse spaces."""
+    return " ".join(unidecode(name).casefold().split())
+
+
+def build_name_index() -> None:
+    # Candidate names keep their dblp suffix, if any, so that "Wei Wang 0001"
+    # only matches that dblp person.
+    for cand in candidate_names:
+        key = name_key(cand)
+        if key not in name_ids:
+            name_ids[key] = len(name_ids)
+        candidate_ids[name_ids[key]].append(cand)
+    print(f"Indexed {len(name_ids)} normalized candidate names.")
+
+
+def lookup_author(author: str) -> int:
+    """Return the author ID of a dblp author string, or -1 if it is not indexed.
+
+    The exact normalized name is tried first. A dblp homonym suffix is only
+    stripped as a fallback, which can match candidates listed without one.
+    """
+    author_id = author_id_cache.get(author)
+    if author_id is None:
+        key = name_key(author)
+        author_id = name_ids.get(key, -1)
+        if author_id == -1 and DBLP_SUFFIX.search(key):
+            author_id = name_ids.get(DBLP_SUFFIX.sub("", key), -1)
+        author_id_cache[author] = author_id
+    return author_id
+
+
 def load_conferences(filename: str) -> None:
     global conf_to_area, conf_to_parent
     with open(filename, newline="", encoding="utf-8") as f:
@@ -182,29 +227,39 @@ def handle_article(_: Any, article: Dict[str, Any]) -> bool:
 
         num_authors = len(authors)
 
-        # For each candidate in the author list, if the name is in candidate_names update scores.
+        # For each author, look up their ID and update the scores of matching candidates.
+        # Each ID is credited once per paper, even if several homonyms map to it.
+        credited = set()
         for idx, author in enumerate(authors):
-            if author not in candidate_names:
+            author_id = lookup_author(author)
+            if author_id in credited or author_id not in candidate_ids:
                 continue
-
-            # (1) Total ICLR points: add full iclr_point.
-            candidate_total[author] += iclr_point
-            # (2) Adjusted ICLR points: add iclr_point divided by the number of authors.
-            candidate_adjusted[author] += iclr_point / num_authors
-            # (3) First author ICLR points:
-            # For Theory conferences (parent area "Theory" case‐insensitive), award adjusted credit.
-            if parentArea.lower() == "theory":
-                candidate_first[author] += iclr_point / num_authors
-            elif idx == 0:
-                candidate_first[author] += iclr_point
-            # (4) Accumulate by parent area.
-            candidate_parent[author][parentArea] += iclr_point
+            credited.add(author_id)
+            for cand in candidate_ids[author_id]:
+                credit_candidate(cand, idx, iclr_point, num_authors, parentArea)
 
     except Exception as e:
         print("Error processing article:", e, file=sys.stderr)
     return True
 
 
+def credit_candidate(
+    author: str, idx: int, iclr_point: float, num_authors: int, parentArea: str
+) -> None:
+    # (1) Total ICLR points: add full iclr_point.
+    candidate_total[author] += iclr_point
+    # (2) Adjusted ICLR points: add iclr_point divided by the number of authors.
+    candidate_adjusted[author] += iclr_point / num_authors
+    # (3) First author ICLR points:
+    # For Theory conferences (parent area "Theory" case‐insensitive), award adjusted credit.
+    if parentArea.lower() == "theory":
+        candidate_first[author] += iclr_point / num_authors
+    elif idx == 0:
+        candidate_first[author] += iclr_point
+    # (4) Accumulate by parent area.
+    candidate_parent[author][parentArea] += iclr_point
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(
         description="Scrape dblp to compute candidate ICLR metrics."
@@ -230,6 +285,7 @@ def main() -> None:
     args = parser.parse_args()
 
     load_candidate_names(args.candidates)
+    build_name_index()
     load_conferences("conferences.csv")
     load_iclr_points("iclr.csv")
 